@@ -609,7 +609,7 @@ class MeanInterbuildingDistance:
             .distance(data.loc[adj_list.neighbor].reset_index())
         )
 
-        print("Computing mean interbuilding distances...")
+        print("Computing mean interbuilding distances...") if verbose else None
         # iterate over objects to get the final values
         for uid in tqdm(data.index, total=data.shape[0], disable=not verbose):
             # define neighbours based on weights matrix defining analysis area
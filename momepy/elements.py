@@ -221,11 +221,10 @@ class Tessellation:
         changes = {}
         qid = 0
 
-        for ix, row in tqdm(tessellation.iterrows(), total=tessellation.shape[0]):
+        for cell in tqdm(tessellation.geometry, total=tessellation.shape[0]):
             corners = []
             change = []
 
-            cell = row.geometry
             coords = cell.exterior.coords
             for i in coords:
                 point = Point(i)
@@ -256,8 +255,9 @@ class Tessellation:
                     changes[(points[1].x, points[1].y)] = new
                     qid = qid + 1
 
-        for ix, row in tqdm(tessellation.iterrows(), total=tessellation.shape[0]):
-            cell = row.geometry
+        for ix, cell in tqdm(
+            tessellation.geometry.iteritems(), total=tessellation.shape[0]
+        ):
             coords = list(cell.exterior.coords)
 
             moves = {}
@@ -7,10 +7,9 @@
 import math
 import random
 
+import geopandas as gpd
 import numpy as np
 import pandas as pd
-from shapely.geometry import Point
-from tqdm import tqdm  # progress bar
 
 __all__ = [
     "FormFactor",
@@ -89,10 +88,10 @@ class FormFactor:
             gdf["mm_a"] = areas
             areas = "mm_a"
         self.areas = gdf[areas]
-        zeros = gdf[volumes] == 0
-        res = np.empty(len(gdf))
-        res[zeros] = 0
-        res[~zeros] = gdf[areas][~zeros] / (gdf[volumes][~zeros] ** (2 / 3))
+        a = gdf[areas].to_numpy(dtype=np.float64)
+        v = gdf[volumes].to_numpy(dtype=np.float64)
+        res = np.zeros(len(gdf), dtype=np.float64)
+        np.divide(a, v ** (2 / 3), out=res, where=v != 0)
         self.series = pd.Series(res, index=gdf.index)
 
 
@@ -252,8 +251,20 @@ class VolumeFacadeRatio:
 
 
 def _make_circle(points):
-    # Convert to float and randomize order
-    shuffled = [(float(x), float(y)) for (x, y) in points]
+    if len(points) == 0:
+        return None
+    # Convert to float (dropping z coordinates) and randomize order
+    shuffled = np.asarray(points, dtype=float)[:, :2].tolist()
+    # Drop closing point of rings
+    if len(shuffled) > 1 and shuffled[0] == shuffled[-1]:
+        shuffled.pop()
+
+    # Circles of up to three points are known without randomization
+    if len(shuffled) == 2:
+        return _make_diameter(shuffled[0], shuffled[1])
+    if len(shuffled) == 3:
+        return _make_circle_three_points(*shuffled)
+
     random.shuffle(shuffled)
 
     # Progressively add points to circle or recompute circle
@@ -319,6 +330,20 @@ def _make_circle_two_points(points, p, q):
     return right
 
 
+# Three points, no randomization needed
+def _make_circle_three_points(p0, p1, p2):
+    # The smallest circle is either spanned by two points with the third inside
+    circ = None
+    for (p, q, r) in ((p0, p1, p2), (p0, p2, p1), (p1, p2, p0)):
+        c = _make_diameter(p, q)
+        if _is_in_circle(c, r) and (circ is None or c[2] < circ[2]):
+            circ = c
+    if circ is not None:
+        return circ
+    # or passes through all three of them
+    return _make_circumcircle(p0, p1, p2)
+
+
 def _make_circumcircle(p0, p1, p2):
     # Mathematical algorithm from Wikipedia: Circumscribed circle
     ax, ay = p0
@@ -387,8 +412,6 @@ def _cross_product(x0, y0, x1, y1, x2, y2):
 
 # calculate the area of circumcircle
 def _circle_area(points):
-    if len(points[0]) == 3:
-        points = [x[:2] for x in points]
     circ = _make_circle(points)
     return math.pi * circ[2] ** 2
 
@@ -437,10 +460,12 @@ class CircularCompactness:
             gdf["mm_a"] = areas
             areas = "mm_a"
         self.areas = gdf[areas]
-        gdf["hull"] = gdf.convex_hull.exterior
-        self.series = gdf[[areas, "hull"]].apply(
-            lambda row: (row[areas]) / (_circle_area(list(row.hull.coords))), axis=1
+        circle_areas = np.fromiter(
+            (_circle_area(hull.coords) for hull in gdf.geometry.convex_hull.exterior),
+            dtype=np.float64,
+            count=len(gdf),
         )
+        self.series = pd.Series(gdf[areas].to_numpy() / circle_areas, index=gdf.index)
 
 
 class SquareCompactness:
@@ -612,6 +637,25 @@ class CourtyardIndex:
         self.series = gdf[courtyard_areas] / gdf[areas]
 
 
+def _minimum_rotated_rectangle(gdf, bbox=None):
+    """
+    Compute minimum rotated rectangle of each geometry, unless precomputed ``bbox``
+    is given. Helper for Rectangularity, EquivalentRectangularIndex and Elongation.
+    """
+    if bbox is not None:
+        if len(bbox) != len(gdf):
+            raise ValueError(
+                f"Length of bbox ({len(bbox)}) does not match length of gdf "
+                f"({len(gdf)})."
+            )
+        # align positionally, labels of bbox are ignored
+        return gpd.GeoSeries(np.asarray(bbox), index=gdf.index)
+    # pygeos.oriented_envelope gives minimum-width, not minimum-area rectangles
+    return gpd.GeoSeries(
+        [geom.minimum_rotated_rectangle for geom in gdf.geometry], index=gdf.index
+    )
+
+
 class Rectangularity:
     """
     Calculates rectangularity of each object in given GeoDataFrame.
@@ -628,6 +672,11 @@ class Rectangularity:
     areas : str, list, np.array, pd.Series (default None)
         the name of the dataframe column, ``np.array``, or ``pd.Series`` where is stored area value. If set to ``None``, function will calculate areas
         during the process without saving them separately.
+    bbox : GeoSeries, list, np.array (default None)
+        minimum rotated rectangles of objects. Pass the same rectangles to
+        :class:`momepy.Rectangularity`, :class:`momepy.EquivalentRectangularIndex`
+        and :class:`momepy.Elongation` to compute them only once. If set to ``None``,
+        function will calculate them during the process without saving them separately.
 
     Attributes
     ----------
@@ -641,13 +690,11 @@ class Rectangularity:
     Examples
     --------
     >>> buildings_df['rectangularity'] = momepy.Rectangularity(buildings_df, 'area').series
-    100%|██████████| 144/144 [00:00<00:00, 866.62it/s]
     >>> buildings_df.rectangularity[0]
     0.6942676157646379
     """
 
-    def __init__(self, gdf, areas=None):
-        # TODO: vectorize minimum_rotated_rectangle after pygeos implementation
+    def __init__(self, gdf, areas=None, bbox=None):
         self.gdf = gdf
         gdf = gdf.copy()
         if areas is None:
@@ -656,10 +703,7 @@ class Rectangularity:
             gdf["mm_a"] = areas
             areas = "mm_a"
         self.areas = gdf[areas]
-        self.series = gdf.apply(
-            lambda row: row[areas] / (row.geometry.minimum_rotated_rectangle.area),
-            axis=1,
-        )
+        self.series = gdf[areas] / _minimum_rotated_rectangle(gdf, bbox).area
 
 
 class ShapeIndex:
@@ -693,7 +737,6 @@ class ShapeIndex:
     Examples
     --------
     >>> buildings_df['shape_index'] = momepy.ShapeIndex(buildings_df, longest_axis='long_ax', areas='area').series
-    100%|██████████| 144/144 [00:00<00:00, 5558.33it/s]
     >>> buildings_df['shape_index'][0]
     0.7564029493781987
     """
@@ -717,11 +760,64 @@ class ShapeIndex:
         )
 
 
+def _exterior_coords(geoms):
+    """
+    Get vertices of exterior rings of all geometries as a single (N, 2) array.
+    Closing vertex of each ring is omitted, non-Polygon and empty geometries have
+    no vertices. Returns array of vertices, array of offsets of each ring in it and
+    boolean mask of Polygon geometries.
+    Helper for Corners, Squareness and CentroidCorners.
+    """
+    polygons = np.array([geom.type == "Polygon" for geom in geoms], dtype=bool)
+    rings = [
+        np.asarray(geom.exterior.coords)[:-1, :2]
+        if polygon and not geom.is_empty
+        else np.empty((0, 2))
+        for geom, polygon in zip(geoms, polygons)
+    ]
+    offsets = np.zeros(len(rings) + 1, dtype=np.int64)
+    np.cumsum([len(ring) for ring in rings], out=offsets[1:])
+    coords = np.concatenate(rings) if rings else np.empty((0, 2))
+    return coords, offsets, polygons
+
+
+def _vertex_cosines(coords, offsets):
+    """
+    Measure cosine of angle at each vertex of rings returned by _exterior_coords.
+    Helper for Corners, Squareness and CentroidCorners.
+    """
+    # positions of previous and next vertex, wrapping around within each ring
+    counts = np.diff(offsets)
+    starts = np.repeat(offsets[:-1], counts)
+    ends = np.repeat(offsets[1:], counts)
+    idx = np.arange(len(coords))
+    prev = np.where(idx == starts, ends - 1, idx - 1)
+    nxt = np.where(idx + 1 == ends, starts, idx + 1)
+
+    bax = coords[prev, 0] - coords[:, 0]
+    bay = coords[prev, 1] - coords[:, 1]
+    bcx = coords[nxt, 0] - coords[:, 0]
+    bcy = coords[nxt, 1] - coords[:, 1]
+
+    cosine_angle = (bax * bcx + bay * bcy) / np.sqrt(
+        (bax * bax + bay * bay) * (bcx * bcx + bcy * bcy)
+    )
+    return np.clip(cosine_angle, -1, 1)
+
+
+# angles are within 0-180 degrees, so true corners are those with angle <= 170
+# (<= 175 for squareness) which is equal to cosine >= cos(170) (cos(175))
+_CORNER_COSINE = np.cos(np.radians(170))
+_SQUARENESS_COSINE = np.cos(np.radians(175))
+
+
 class Corners:
     """
     Calculates number of corners of each object in given GeoDataFrame.
 
     Uses only external shape (``shapely.geometry.exterior``), courtyards are not included.
+    Angles are measured in the xy plane, z coordinates of 3D geometries are ignored.
+    Returns ``NaN`` for geometries other than Polygon.
 
     .. math::
         \\sum corner
@@ -731,7 +827,7 @@ class Corners:
     gdf : GeoDataFrame
         GeoDataFrame containing objects
     verbose : bool (default True)
-        if True, shows progress bars in loops and indication of steps
+        kept for backwards compatibility, has no effect
 
     Attributes
     ----------
@@ -744,7 +840,6 @@ class Corners:
     Examples
     --------
     >>> buildings_df['corners'] = momepy.Corners(buildings_df).series
-    100%|██████████| 144/144 [00:00<00:00, 1042.15it/s]
     >>> buildings_df.corners[0]
     24
 
@@ -754,56 +849,17 @@ class Corners:
     def __init__(self, gdf, verbose=True):
         self.gdf = gdf
 
-        # define empty list for results
-        results_list = []
-
-        # calculate angle between points, return true or false if real corner
-        def _true_angle(a, b, c):
-            ba = a - b
-            bc = c - b
-
-            cosine_angle = np.dot(ba, bc) / (np.linalg.norm(ba) * np.linalg.norm(bc))
-            angle = np.arccos(cosine_angle)
-
-            if np.degrees(angle) <= 170:
-                return True
-            if np.degrees(angle) >= 190:
-                return True
-            return False
-
-        # fill new column with the value of area, iterating over rows one by one
-        for geom in tqdm(gdf.geometry, total=gdf.shape[0], disable=not verbose):
-            corners = 0  # define empty variables
-            points = list(geom.exterior.coords)  # get points of a shape
-            stop = len(points) - 1  # define where to stop
-            for i in np.arange(
-                len(points)
-            ):  # for every point, calculate angle and add 1 if True angle
-                if i == 0:
-                    continue
-                elif i == stop:
-                    a = np.asarray(points[i - 1])
-                    b = np.asarray(points[i])
-                    c = np.asarray(points[1])
-
-                    if _true_angle(a, b, c) is True:
-                        corners = corners + 1
-                    else:
-                        continue
-
-                else:
-                    a = np.asarray(points[i - 1])
-                    b = np.asarray(points[i])
-                    c = np.asarray(points[i + 1])
+        coords, offsets, polygons = _exterior_coords(gdf.geometry)
+        corners = _vertex_cosines(coords, offsets) >= _CORNER_COSINE
 
-                    if _true_angle(a, b, c) is True:
-                        corners = corners + 1
-                    else:
-                        continue
+        # count only real corners of each ring
+        ring_ids = np.repeat(np.arange(len(gdf)), np.diff(offsets))
+        results = np.bincount(ring_ids[corners], minlength=len(gdf)).astype(np.int64)
+        if not polygons.all():
+            results = results.astype(np.float64)
+            results[~polygons] = np.nan
 
-            results_list.append(corners)
-
-        self.series = pd.Series(results_list, index=gdf.index)
+        self.series = pd.Series(results, index=gdf.index)
 
 
 class Squareness:
@@ -811,6 +867,8 @@ class Squareness:
     Calculates squareness of each object in given GeoDataFrame.
 
     Uses only external shape (``shapely.geometry.exterior``), courtyards are not included.
+    Angles are measured in the xy plane, z coordinates of 3D geometries are ignored.
+    Returns ``NaN`` for geometries other than Polygon.
 
     .. math::
         \\mu=\\frac{\\sum_{i=1}^{N} d_{i}}{N}
@@ -824,7 +882,7 @@ class Squareness:
     gdf : GeoDataFrame
         GeoDataFrame containing objects
     verbose : bool (default True)
-        if True, shows progress bars in loops and indication of steps
+        kept for backwards compatibility, has no effect
 
     Attributes
     ----------
@@ -836,68 +894,27 @@ class Squareness:
     Examples
     --------
     >>> buildings_df['squareness'] = momepy.Squareness(buildings_df).series
-    100%|██████████| 144/144 [00:01<00:00, 129.49it/s]
     >>> buildings_df.squareness[0]
     3.7075816043359864
     """
 
     def __init__(self, gdf, verbose=True):
         self.gdf = gdf
-        # define empty list for results
-        results_list = []
-
-        def _angle(a, b, c):
-            ba = a - b
-            bc = c - b
-
-            cosine_angle = np.dot(ba, bc) / (np.linalg.norm(ba) * np.linalg.norm(bc))
-            angle = np.degrees(np.arccos(cosine_angle))
-
-            return angle
-
-        # fill new column with the value of area, iterating over rows one by one
-        for geom in tqdm(gdf.geometry, total=gdf.shape[0], disable=not verbose):
-            if geom.type == "Polygon":
-                angles = []
-                points = list(geom.exterior.coords)  # get points of a shape
-                stop = len(points) - 1  # define where to stop
-                for i in np.arange(
-                    len(points)
-                ):  # for every point, calculate angle and add 1 if True angle
-                    if i == 0:
-                        continue
-                    elif i == stop:
-                        a = np.asarray(points[i - 1])
-                        b = np.asarray(points[i])
-                        c = np.asarray(points[1])
-                        ang = _angle(a, b, c)
-
-                        if ang <= 175:
-                            angles.append(ang)
-                        elif _angle(a, b, c) >= 185:
-                            angles.append(ang)
-                        else:
-                            continue
-
-                    else:
-                        a = np.asarray(points[i - 1])
-                        b = np.asarray(points[i])
-                        c = np.asarray(points[i + 1])
-                        ang = _angle(a, b, c)
-
-                        if _angle(a, b, c) <= 175:
-                            angles.append(ang)
-                        elif _angle(a, b, c) >= 185:
-                            angles.append(ang)
-                        else:
-                            continue
-                deviations = [abs(90 - i) for i in angles]
-                results_list.append(np.mean(deviations))
-
-            else:
-                results_list.append(np.nan)
+        coords, offsets, _ = _exterior_coords(gdf.geometry)
+        cosines = _vertex_cosines(coords, offsets)
+        corners = cosines >= _SQUARENESS_COSINE
+        angles = np.degrees(np.arccos(cosines[corners]))
+
+        # mean deviation of corners of each ring, NaN for non-Polygon geometries
+        ring_ids = np.repeat(np.arange(len(gdf)), np.diff(offsets))[corners]
+        deviations = np.bincount(
+            ring_ids, weights=np.abs(90 - angles), minlength=len(gdf)
+        )
+        counts = np.bincount(ring_ids, minlength=len(gdf))
+        with np.errstate(invalid="ignore"):
+            results = deviations / counts
 
-        self.series = pd.Series(results_list, index=gdf.index)
+        self.series = pd.Series(results, index=gdf.index)
 
 
 class EquivalentRectangularIndex:
@@ -919,6 +936,11 @@ class EquivalentRectangularIndex:
     perimeters : str, list, np.array, pd.Series (default None)
         the name of the dataframe column, ``np.array``, or ``pd.Series`` where is stored perimeter value. If set to ``None``, function will calculate perimeters
         during the process without saving them separately.
+    bbox : GeoSeries, list, np.array (default None)
+        minimum rotated rectangles of objects. Pass the same rectangles to
+        :class:`momepy.Rectangularity`, :class:`momepy.EquivalentRectangularIndex`
+        and :class:`momepy.Elongation` to compute them only once. If set to ``None``,
+        function will calculate them during the process without saving them separately.
 
     Attributes
     ----------
@@ -938,7 +960,7 @@ class EquivalentRectangularIndex:
     0.7879229963118455
     """
 
-    def __init__(self, gdf, areas=None, perimeters=None):
+    def __init__(self, gdf, areas=None, perimeters=None, bbox=None):
         self.gdf = gdf
         # define empty list for results
         gdf = gdf.copy()
@@ -959,9 +981,14 @@ class EquivalentRectangularIndex:
                 gdf["mm_a"] = areas
                 areas = "mm_a"
         self.areas = gdf[areas]
-        # TODO: vectorize minimum_rotated_rectangle after pygeos implementation
-        bbox = gdf.geometry.apply(lambda g: g.minimum_rotated_rectangle)
-        res = np.sqrt(gdf[areas] / bbox.area) * (bbox.length / gdf[perimeters])
+        bbox = _minimum_rotated_rectangle(gdf, bbox)
+        a = gdf[areas].to_numpy(dtype=np.float64)
+        p = gdf[perimeters].to_numpy(dtype=np.float64)
+        # in-place operations avoid allocating temporary arrays
+        res = a / bbox.area.to_numpy()
+        np.sqrt(res, out=res)
+        res *= bbox.length.to_numpy()
+        res /= p
 
         self.series = pd.Series(res, index=gdf.index)
 
@@ -981,6 +1008,11 @@ class Elongation:
     ----------
     gdf : GeoDataFrame
         GeoDataFrame containing objects
+    bbox : GeoSeries, list, np.array (default None)
+        minimum rotated rectangles of objects. Pass the same rectangles to
+        :class:`momepy.Rectangularity`, :class:`momepy.EquivalentRectangularIndex`
+        and :class:`momepy.Elongation` to compute them only once. If set to ``None``,
+        function will calculate them during the process without saving them separately.
 
     Attributes
     ----------
@@ -996,28 +1028,20 @@ class Elongation:
     0.9082437463675544
     """
 
-    def __init__(self, gdf):
+    def __init__(self, gdf, bbox=None):
         self.gdf = gdf
 
-        # TODO: vectorize minimum_rotated_rectangle after pygeos implementation
-        bbox = gdf.geometry.apply(lambda g: g.minimum_rotated_rectangle)
-        a = bbox.area
-        p = bbox.length
-        cond1 = p ** 2
-        cond2 = 16 * a
-        bigger = cond1 >= cond2
-        sqrt = np.empty(len(a))
-        sqrt[bigger] = cond1[bigger] - cond2[bigger]
-        sqrt[~bigger] = 0
+        bbox = _minimum_rotated_rectangle(gdf, bbox)
+        a = bbox.area.to_numpy()
+        p = bbox.length.to_numpy()
+        sqrt = np.sqrt(np.maximum(p ** 2 - 16 * a, 0))
 
         # calculate both width/length and length/width
-        elo1 = ((p - np.sqrt(sqrt)) / 4) / ((p / 2) - ((p - np.sqrt(sqrt)) / 4))
-        elo2 = ((p + np.sqrt(sqrt)) / 4) / ((p / 2) - ((p + np.sqrt(sqrt)) / 4))
+        elo1 = ((p - sqrt) / 4) / ((p / 2) - ((p - sqrt) / 4))
+        elo2 = ((p + sqrt) / 4) / ((p / 2) - ((p + sqrt) / 4))
 
         # use the smaller one (e.g. shorter/longer)
-        res = np.empty(len(a))
-        res[elo1 <= elo2] = elo1[elo1 <= elo2]
-        res[~(elo1 <= elo2)] = elo2[~(elo1 <= elo2)]
+        res = np.minimum(elo1, elo2)
 
         self.series = pd.Series(res, index=gdf.index)
 
@@ -1026,6 +1050,9 @@ class CentroidCorners:
     """
     Calculates mean distance centroid - corners and st. deviation.
 
+    Corners are detected in the xy plane, z coordinates of 3D geometries are ignored.
+    Returns ``NaN`` for geometries other than Polygon.
+
     .. math::
         \\overline{x}=\\frac{1}{n}\\left(\\sum_{i=1}^{n} dist_{i}\\right);\\space \\mathrm{SD}=\\sqrt{\\frac{\\sum|x-\\overline{x}|^{2}}{n}}
 
@@ -1036,7 +1063,7 @@ class CentroidCorners:
     gdf : GeoDataFrame
         GeoDataFrame containing objects
     verbose : bool (default True)
-        if True, shows progress bars in loops and indication of steps
+        kept for backwards compatibility, has no effect
 
     Attributes
     ----------
@@ -1050,7 +1077,6 @@ class CentroidCorners:
     Examples
     --------
     >>> ccd = momepy.CentroidCorners(buildings_df)
-    100%|██████████| 144/144 [00:00<00:00, 846.58it/s]
     >>> buildings_df['ccd_means'] = ccd.means
     >>> buildings_df['ccd_stdev'] = ccd.std
     >>> buildings_df['ccd_means'][0]
@@ -1061,76 +1087,42 @@ class CentroidCorners:
 
     def __init__(self, gdf, verbose=True):
         self.gdf = gdf
-        # define empty list for results
-        results_list = []
-        results_list_sd = []
-
-        # calculate angle between points, return true or false if real corner
-        def true_angle(a, b, c):
-            ba = a - b
-            bc = c - b
-
-            cosine_angle = np.dot(ba, bc) / (np.linalg.norm(ba) * np.linalg.norm(bc))
-            angle = np.arccos(cosine_angle)
-
-            if np.degrees(angle) <= 170:
-                return True
-            if np.degrees(angle) >= 190:
-                return True
-            return False
-
-        # iterating over rows one by one
-        for geom in tqdm(gdf.geometry, total=gdf.shape[0], disable=not verbose):
-            distances = []  # set empty list of distances
-            centroid = geom.centroid  # define centroid
-            points = list(geom.exterior.coords)  # get points of a shape
-            stop = len(points) - 1  # define where to stop
-            for i in np.arange(
-                len(points)
-            ):  # for every point, calculate angle and add 1 if True angle
-                if i == 0:
+        coords, offsets, polygons = _exterior_coords(gdf.geometry)
+        corners = _vertex_cosines(coords, offsets) >= _CORNER_COSINE
+        centroids = gdf.geometry.centroid
+
+        # distances of real corners to centroid of their geometry
+        ring_ids = np.repeat(np.arange(len(gdf)), np.diff(offsets))[corners]
+        points = coords[corners]
+        distances = np.hypot(
+            points[:, 0] - centroids.x.to_numpy()[ring_ids],
+            points[:, 1] - centroids.y.to_numpy()[ring_ids],
+        )
+
+        # calculate mean and st.dev
+        counts = np.bincount(ring_ids, minlength=len(gdf))
+        with np.errstate(invalid="ignore"):
+            results = np.bincount(ring_ids, weights=distances, minlength=len(gdf))
+            results = results / counts
+            deviations = (distances - results[ring_ids]) ** 2
+            results_sd = np.sqrt(
+                np.bincount(ring_ids, weights=deviations, minlength=len(gdf)) / counts
+            )
+
+        # circular buildings, i.e. polygons without corners
+        circular = np.flatnonzero((counts == 0) & polygons)
+        if circular.size:
+            from momepy.dimension import _longest_axis
+
+            for idx in circular:
+                geom = gdf.geometry.iloc[idx]
+                if geom.is_empty:
                     continue
-                elif i == stop:
-                    a = np.asarray(points[i - 1])
-                    b = np.asarray(points[i])
-                    c = np.asarray(points[1])
-                    p = Point(points[i])
-
-                    if true_angle(a, b, c) is True:
-                        distance = centroid.distance(
-                            p
-                        )  # calculate distance point - centroid
-                        distances.append(distance)  # add distance to the list
-                    else:
-                        continue
-
-                else:
-                    a = np.asarray(points[i - 1])
-                    b = np.asarray(points[i])
-                    c = np.asarray(points[i + 1])
-                    p = Point(points[i])
-
-                    if true_angle(a, b, c) is True:
-                        distance = centroid.distance(p)
-                        distances.append(distance)
-                    else:
-                        continue
-            if not distances:  # circular buildings
-                from momepy.dimension import _longest_axis
-
-                if geom.has_z:
-                    coords = [
-                        (coo[0], coo[1]) for coo in geom.convex_hull.exterior.coords
-                    ]
-                else:
-                    coords = geom.convex_hull.exterior.coords
-                results_list.append(_longest_axis(coords) / 2)
-                results_list_sd.append(0)
-            else:
-                results_list.append(np.mean(distances))  # calculate mean
-                results_list_sd.append(np.std(distances))  # calculate st.dev
-        self.mean = pd.Series(results_list, index=gdf.index)
-        self.std = pd.Series(results_list_sd, index=gdf.index)
+                results[idx] = _longest_axis(geom.convex_hull.exterior.coords) / 2
+                results_sd[idx] = 0
+
+        self.mean = pd.Series(results, index=gdf.index)
+        self.std = pd.Series(results_sd, index=gdf.index)
 
 
 class Linearity:
@@ -1149,7 +1141,7 @@ class Linearity:
     gdf : GeoDataFrame
         GeoDataFrame containing objects
     verbose : bool (default True)
-        if True, shows progress bars in loops and indication of steps
+        kept for backwards compatibility, has no effect
 
     Attributes
     ----------
@@ -1168,14 +1160,13 @@ class Linearity:
     def __init__(self, gdf, verbose=True):
         self.gdf = gdf
 
-        euclidean = gdf.geometry.apply(
-            lambda geom: self._dist(geom.coords[0], geom.coords[-1])
-        )
+        # get first and last point of each LineString
+        ends = np.array(
+            [(geom.coords[0][:2], geom.coords[-1][:2]) for geom in gdf.geometry]
+        ).reshape(-1, 4)
+        euclidean = np.hypot(ends[:, 2] - ends[:, 0], ends[:, 3] - ends[:, 1])
         self.series = euclidean / gdf.geometry.length
 
-    def _dist(self, a, b):
-        return math.hypot(b[0] - a[0], b[1] - a[1])
-
 
 class CompactnessWeightedAxis:
     """
@@ -72,12 +72,11 @@ def _generate_primal(G, gdf_network, fields):
     """
     G.graph["approach"] = "primal"
     key = 0
-    for index, row in gdf_network.iterrows():
-        first = row.geometry.coords[0]
-        last = row.geometry.coords[-1]
+    for row in gdf_network[fields].itertuples(index=False, name=None):
+        attributes = dict(zip(fields, row))
+        first = attributes["geometry"].coords[0]
+        last = attributes["geometry"].coords[-1]
 
-        data = [row[f] for f in fields]
-        attributes = dict(zip(fields, data))
         G.add_edge(first, last, key=key, **attributes)
         key += 1
 
@@ -91,18 +90,18 @@ def _generate_dual(G, gdf_network, fields):
     sw = libpysal.weights.Queen.from_dataframe(gdf_network)
     gdf_network["mm_cent"] = gdf_network.geometry.centroid
 
-    for i, (index, row) in enumerate(gdf_network.iterrows()):
-        centroid = (row.mm_cent.x, row.mm_cent.y)
-        data = [row[f] for f in fields]
-        attributes = dict(zip(fields, data))
+    rows = gdf_network[fields].itertuples(index=False, name=None)
+    for i, (cent, row) in enumerate(zip(gdf_network["mm_cent"], rows)):
+        centroid = (cent.x, cent.y)
+        attributes = dict(zip(fields, row))
         G.add_node(centroid, **attributes)
 
         if sw.cardinalities[i] > 0:
             for n in sw.neighbors[i]:
                 start = centroid
                 end = list(gdf_network.iloc[n]["mm_cent"].coords)[0]
-                p0 = row.geometry.coords[0]
-                p1 = row.geometry.coords[-1]
+                p0 = attributes["geometry"].coords[0]
+                p1 = attributes["geometry"].coords[-1]
                 p2 = gdf_network.iloc[n]["geometry"].coords[0]
                 p3 = gdf_network.iloc[n]["geometry"].coords[-1]
                 points = [p0, p1, p2, p3]
@@ -2,9 +2,11 @@
 # -*- coding: utf-8 -*-
 from distutils.version import LooseVersion
 
+import geopandas as gpd
 import libpysal
 import numpy as np
-import geopandas as gpd
+from scipy import sparse
+from shapely.prepared import prep
 
 GPD_08 = str(gpd.__version__) >= LooseVersion("0.8.0")
 
@@ -16,11 +18,16 @@ class DistanceBand:
     On demand distance-based spatial weights-like class.
 
     Mimic the behavior of ``libpysal.weights.DistanceBand`` but do not compute all
-    neighbors at once but only on demand. Only ``DistanceBand.neighbors[key]`` is
-    implemented. Once user asks for ``DistanceBand.neighbors[key]``, neighbors for
-    specified key will be computed using rtree. The algorithm is significantly
-    slower than ``libpysal.weights.DistanceBand`` but allows for large number of
-    neighbors which may cause memory issues in libpysal.
+    neighbors at once but only on demand. Only ``DistanceBand.neighbors[key]`` and
+    ``DistanceBand.build_all()`` are implemented. Once user asks for
+    ``DistanceBand.neighbors[key]``, neighbors for specified key will be computed
+    using spatial index. The algorithm is significantly slower than
+    ``libpysal.weights.DistanceBand`` but allows for large number of neighbors which
+    may cause memory issues in libpysal.
+
+    If memory allows, ``DistanceBand.build_all()`` computes neighbors of all
+    features at once using a single bulk query of spatial index (requires
+    geopandas >= 0.8.0). ``DistanceBand.neighbors[key]`` is then a simple lookup.
 
     Use ``libpysal.weights.DistanceBand`` if possible. ``momepy.weights.DistanceBand``
     only when necessary. ``DistanceBand.neighbors[key]`` should yield same results as
@@ -37,6 +44,9 @@ class DistanceBand:
         If ``False``, works with the geometry as it is.
     ids : str
         column to be used as geometry ids. If not set, integer position is used.
+    cache : bool (default False)
+        store neighbors once computed for faster repeated access. Memory use then
+        grows with each new key, up to that of ``libpysal.weights.DistanceBand``.
 
     Attributes
     ----------
@@ -45,58 +55,88 @@ class DistanceBand:
 
     """
 
-    def __init__(self, gdf, threshold, centroid=True, ids=None):
-        if centroid:
-            gdf.geometry = gdf.centroid
+    def __init__(self, gdf, threshold, centroid=True, ids=None, cache=False):
+        geoms = gdf.centroid if centroid else gdf.geometry
+        if ids:
+            ids = gdf[ids]
 
-        self.neighbors = _Neighbors(gdf, threshold, ids=ids)
+        self.neighbors = _Neighbors(geoms, threshold, ids=ids, cache=cache)
 
-    def fetch_items(self, key):
+    def build_all(self):
+        """
+        Compute neighbors of all features at once.
+
+        Uses a single bulk query of the spatial index instead of querying it for each
+        key separately. Once computed, ``DistanceBand.neighbors[key]`` is a simple
+        lookup. Requires geopandas >= 0.8.0.
+        """
         if not GPD_08:
-            possible_matches_index = list(
-                self.sindex.intersection(self.bufferred[key].bounds)
+            raise ImportError(
+                "The 'geopandas' >= 0.8.0 package is required to use build_all."
             )
-            possible_matches = self.geoms.iloc[possible_matches_index]
-            match = possible_matches.index[
-                possible_matches.intersects(self.bufferred[key])
-            ].to_list()
-            match.remove(key)
-        else:
-            hits = self.sindex.query(self.bufferred[key], predicate="intersects")
-            match = self.geoms.iloc[hits].index.to_list()
-            match.remove(key)
-        return match
+        nb = self.neighbors
+        focal, neighbor = nb.sindex.query_bulk(nb.bufferred, predicate="intersects")
+        mask = focal != neighbor
+        focal, neighbor = focal[mask], neighbor[mask]
+        order = np.argsort(focal, kind="stable")
+        focal, neighbor = focal[order], neighbor[order]
+
+        groups = np.split(neighbor, np.searchsorted(focal, np.arange(1, len(nb.ids))))
+        for key, group in zip(nb.ids, groups):
+            nb[key] = list(nb.ids[group]) if nb.ids_bool else group.tolist()
 
 
-class _Neighbors(dict, DistanceBand):
+class _Neighbors(dict):
     """
     Helper class for DistanceBand.
     """
 
-    def __init__(self, geoms, buffer, ids):
-        self.geoms = geoms
+    def __init__(self, geoms, buffer, ids, cache=False):
+        # positional arrays keep pandas indexing out of fetch_items
+        self.geoms = geoms.values
+        self.cache = cache
         self.sindex = geoms.sindex
-        self.bufferred = geoms.buffer(buffer)
-        if ids:
-            self.ids = np.array(geoms[ids])
-        else:
-            self.ids = range(len(self.geoms))
-        if ids:
+        bufferred = geoms.buffer(buffer)
+        self.bufferred = bufferred.values
+        if not GPD_08:
+            self.bounds = bufferred.bounds.values
+        if ids is not None:
+            self.ids = np.array(ids)
             self.ids_bool = True
+            self.id_to_int = {v: i for i, v in enumerate(self.ids)}
         else:
+            self.ids = np.arange(len(self.geoms))
             self.ids_bool = False
 
     def __missing__(self, key):
         if self.ids_bool:
-            int_id = np.where(self.ids == key)[0][0]
+            int_id = self.id_to_int[key]
             integers = self.fetch_items(int_id)
-            return list(self.ids[integers])
+            match = list(self.ids[integers])
         else:
-            return self.fetch_items(key)
+            match = self.fetch_items(key)
+        if self.cache:
+            self[key] = match
+        return match
 
     def keys(self):
         return self.ids
 
+    def fetch_items(self, key):
+        if not GPD_08:
+            possible_matches_index = self.sindex.intersection(self.bounds[key])
+            bufferred = prep(self.bufferred[key])
+            match = [
+                i for i in possible_matches_index if bufferred.intersects(self.geoms[i])
+            ]
+            match.remove(key)
+        else:
+            match = self.sindex.query(
+                self.bufferred[key], predicate="intersects"
+            ).tolist()
+            match.remove(key)
+        return match
+
 
 def sw_high(k, gdf=None, weights=None, ids=None, contiguity="queen", silent=True):
     """
@@ -153,16 +193,23 @@ def sw_high(k, gdf=None, weights=None, ids=None, contiguity="queen", silent=True
 
     if k > 1:
         id_order = first_order.id_order
-        w = first_order.sparse
-        wk = sum(map(lambda x: w ** x, range(2, k + 1)))
-        rk, ck = wk.nonzero()
-        sk = set(zip(rk, ck))
-        sk = set([(i, j) for i, j in sk if i != j])
-        d = dict([(i, []) for i in id_order])
-        for pair in sk:
-            k, v = pair
-            k = id_order[k]
-            v = id_order[v]
-            d[k].append(v)
-        return libpysal.weights.W(neighbors=d, silence_warnings=silent)
+        w = first_order.sparse.tocsr(copy=True)
+        w.data[:] = 1
+
+        # binary pattern of w + w ** 2 + ... + w ** k
+        power = w
+        wk = w.copy()
+        for _ in range(2, k + 1):
+            power = power @ w
+            power.data[:] = 1
+            wk = wk + power
+
+        # drop self-neighbors
+        wk = wk - sparse.diags(wk.diagonal())
+        wk.eliminate_zeros()
+        wk.data[:] = 1
+
+        return libpysal.weights.WSP(wk, id_order=id_order).to_W(
+            silence_warnings=silent
+        )
     return first_order
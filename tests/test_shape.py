@@ -3,10 +3,11 @@ import math
 import geopandas as gpd
 import momepy as mm
 import numpy as np
+import pytest
 from pytest import approx
-from shapely.geometry import Point, Polygon
+from shapely.geometry import MultiPolygon, Point, Polygon
 
-from momepy.shape import _circle_area
+from momepy.shape import _circle_area, _make_circle
 
 
 class TestShape:
@@ -36,6 +37,12 @@ class TestShape:
         )
         assert self.df_buildings["ff"][0] == check
 
+        volumes = self.df_buildings.volume.copy()
+        volumes[1] = 0
+        ff = mm.FormFactor(self.df_buildings, volumes).series
+        assert ff[0] == check
+        assert ff[1] == 0
+
     def test_FractalDimension(self):
         self.df_buildings["fd"] = mm.FractalDimension(self.df_buildings).series
         check = (
@@ -94,8 +101,9 @@ class TestShape:
         ).series
         assert self.df_buildings["circom2"][0] == check
 
-        self.df_buildings["circom3"] = mm.CircularCompactness(self.df_buildings).series
-        assert self.df_buildings["circom3"][0] == check
+        circom3 = mm.CircularCompactness(self.df_buildings).series
+        assert circom3[0] == check
+        assert circom3.name is None
 
     def test_SquareCompactness(self):
         self.df_buildings["sqcom"] = mm.SquareCompactness(self.df_buildings).series
@@ -149,6 +157,22 @@ class TestShape:
         assert self.df_buildings["rect"][0] == check
         assert self.df_buildings["rect_array"][0] == check
 
+        bbox = [geom.minimum_rotated_rectangle for geom in self.df_buildings.geometry]
+        rect_bbox = mm.Rectangularity(self.df_buildings, bbox=bbox).series
+        assert rect_bbox[0] == check
+
+        # bbox is aligned by position, not by index
+        bbox = self.df_buildings.geometry.apply(lambda g: g.minimum_rotated_rectangle)
+        reindexed = self.df_buildings.set_index("uID")
+        rect_reindexed = mm.Rectangularity(reindexed, bbox=bbox).series
+        assert (rect_reindexed.index == reindexed.index).all()
+        assert rect_reindexed.iloc[0] == check
+        assert not rect_reindexed.isna().any()
+        assert rect_reindexed.tolist() == self.df_buildings["rect"].tolist()
+
+        with pytest.raises(ValueError):
+            mm.Rectangularity(self.df_buildings, bbox=bbox[:10])
+
     def test_ShapeIndex(self):
         la = self.df_buildings["la"] = mm.LongestAxisLength(self.df_buildings).series
         self.df_buildings["shape_index"] = mm.ShapeIndex(self.df_buildings, "la").series
@@ -166,6 +190,17 @@ class TestShape:
         check = 24
         assert self.df_buildings["corners"][0] == check
 
+        empty = gpd.GeoDataFrame(geometry=[self.df_buildings.geometry[0], Polygon()])
+        corners = mm.Corners(empty).series
+        assert corners[0] == check
+        assert corners[1] == 0
+
+        geom = self.df_buildings.geometry[0]
+        multi = gpd.GeoDataFrame(geometry=[geom, MultiPolygon([geom])])
+        corners = mm.Corners(multi).series
+        assert corners[0] == check
+        assert np.isnan(corners[1])
+
     def test_Squareness(self):
         self.df_buildings["squ"] = mm.Squareness(self.df_buildings).series
         check = approx(3.707, rel=1e-3)
@@ -173,6 +208,11 @@ class TestShape:
         self.df_buildings["squ"] = mm.Squareness(self.df_buildings.exterior).series
         assert self.df_buildings["squ"].isna().all()
 
+        empty = gpd.GeoDataFrame(geometry=[self.df_buildings.geometry[0], Polygon()])
+        squ = mm.Squareness(empty).series
+        assert squ[0] == check
+        assert np.isnan(squ[1])
+
     def test_EquivalentRectangularIndex(self):
         self.df_buildings["eri"] = mm.EquivalentRectangularIndex(
             self.df_buildings
@@ -186,11 +226,19 @@ class TestShape:
         assert self.df_buildings["eri"][0] == check
         assert self.df_buildings["eri_array"][0] == check
 
+        bbox = self.df_buildings.geometry.apply(lambda g: g.minimum_rotated_rectangle)
+        eri_bbox = mm.EquivalentRectangularIndex(self.df_buildings, bbox=bbox).series
+        assert eri_bbox[0] == check
+
     def test_Elongation(self):
         self.df_buildings["elo"] = mm.Elongation(self.df_buildings).series
         check = approx(0.908, rel=1e-3)
         assert self.df_buildings["elo"][0] == check
 
+        bbox = self.df_buildings.geometry.apply(lambda g: g.minimum_rotated_rectangle)
+        elo_bbox = mm.Elongation(self.df_buildings, bbox=bbox).series
+        assert elo_bbox[0] == check
+
     def test_CentroidCorners(self):
         self.df_buildings.loc[144] = [145, Point(0, 0).buffer(10), 0, 0]
         self.df_buildings.loc[145] = [
@@ -207,6 +255,14 @@ class TestShape:
         assert self.df_buildings["ccd"][0] == check
         assert self.df_buildings["ccddev"][0] == check_devs
 
+        geom = self.df_buildings.geometry[0]
+        multi = gpd.GeoDataFrame(geometry=[geom, MultiPolygon([geom])])
+        cc = mm.CentroidCorners(multi)
+        assert cc.mean[0] == check
+        assert cc.std[0] == check_devs
+        assert np.isnan(cc.mean[1])
+        assert np.isnan(cc.std[1])
+
     def test_Linearity(self):
         self.df_streets["lin"] = mm.Linearity(self.df_streets).series
         euclidean = Point(self.df_streets.geometry[0].coords[0]).distance(
@@ -231,3 +287,15 @@ class TestShape:
         poly = Polygon([(0, 1, 0), (1, 1, 0), (2, 4, 0)])
         check = _circle_area(poly.exterior.coords)
         assert check == approx(10.210, rel=1e-3)
+
+    def test__make_circle(self):
+        # obtuse triangle, diameter of the longest side
+        obtuse = [(0, 0), (4, 0), (1, 1)]
+        assert _make_circle(obtuse) == approx((2, 0, 2))
+        # acute triangle, circumcircle
+        assert _make_circle([(0, 0), (2, 0), (1, 2)]) == approx((1, 0.75, 1.25))
+        # collinear points, diameter of the end points
+        assert _make_circle([(0, 0), (3, 0), (1, 0)]) == approx((1.5, 0, 1.5))
+        # closed ring
+        assert _make_circle(obtuse + [(0, 0)]) == approx(_make_circle(obtuse))
+        assert _make_circle([]) is None
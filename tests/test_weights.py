@@ -1,8 +1,12 @@
+from distutils.version import LooseVersion
+
 import geopandas as gpd
 import libpysal
 import momepy as mm
 import pytest
 
+GPD_08 = str(gpd.__version__) >= LooseVersion("0.8.0")
+
 
 class TestWeights:
     def setup_method(self):
@@ -22,6 +26,15 @@ class TestWeights:
         assert sorted(from_df.neighbors[0]) == check
         assert sorted(rook.neighbors[0]) == check
 
+        # chain 0-1-2-3-4, first order neighbors share no neighbor
+        chain = libpysal.weights.W({0: [1], 1: [0, 2], 2: [1, 3], 3: [2, 4], 4: [3]})
+        second = mm.sw_high(2, weights=chain)
+        assert sorted(second.neighbors[0]) == [1, 2]
+        assert sorted(second.neighbors[2]) == [0, 1, 3, 4]
+        third = mm.sw_high(3, weights=chain)
+        assert sorted(third.neighbors[0]) == [1, 2, 3]
+        assert sorted(third.neighbors[4]) == [1, 2, 3]
+
         with pytest.raises(AttributeError):
             mm.sw_high(2, gdf=None, weights=None)
 
@@ -43,7 +56,30 @@ class TestWeights:
             assert k in db_ids.neighbors.keys()
             assert sorted(lp_ids.neighbors[k]) == sorted(db_ids.neighbors[k])
 
-        db_cent_false = mm.DistanceBand(self.df_buildings, 100, centroid=False)
+        assert (self.df_buildings.geom_type == "Polygon").all()
+
+        db_cache = mm.DistanceBand(self.df_buildings, 100, cache=True)
+        assert sorted(lp.neighbors[0]) == sorted(db_cache.neighbors[0])
+        assert 0 in dict.keys(db_cache.neighbors)
+        assert 0 not in dict.keys(db.neighbors)
+
+        db_cent_false = mm.DistanceBand(self.df_buildings.centroid, 100, centroid=False)
         assert sorted(db_cent_false.neighbors[0]) == sorted(
             [125, 133, 114, 134, 113, 121]
         )
+
+    @pytest.mark.skipif(not GPD_08, reason="requires geopandas > 0.7")
+    def test_DistanceBand_build_all(self):
+        lp = libpysal.weights.DistanceBand.from_dataframe(self.df_buildings, 100)
+        lp_ids = libpysal.weights.DistanceBand.from_dataframe(
+            self.df_buildings, 100, ids="uID"
+        )
+        db = mm.DistanceBand(self.df_buildings, 100)
+        db.build_all()
+        db_ids = mm.DistanceBand(self.df_buildings, 100, ids="uID")
+        db_ids.build_all()
+
+        for k in range(len(self.df_buildings)):
+            assert sorted(lp.neighbors[k]) == sorted(db.neighbors[k])
+        for k in self.df_buildings.uID:
+            assert sorted(lp_ids.neighbors[k]) == sorted(db_ids.neighbors[k])